@@ -1,14 +1,19 @@
 """
 Flask routes for Wikipedia API wrapper
 """
+import os
 import markdown
 from flask import Flask, jsonify, request, render_template
 from flask_cors import CORS
 from wikipedia.wikipedia_api import WikipediaAPIWrapper
 from exception import CustomException
+from profiler import RequestProfiler
 
 app = Flask(__name__)
+app.config['PROFILING_ENABLED'] = os.environ.get('PROFILING_ENABLED', '').lower() in ('1', 'true')
+app.config['PROFILING_SAMPLE_RATE'] = int(os.environ.get('PROFILING_SAMPLE_RATE', 0))
 CORS(app)
+RequestProfiler(app)
 wrapper = WikipediaAPIWrapper()
 
 
@@ -31,13 +36,15 @@ def get_most_viewed_articles():
     day = request.args.get('day')
     start_day = request.args.get('start_day')
     end_day = request.args.get('end_day')
+    top_n = request.args.get('top_n')
 
     day = int(day) if day else None
     start_day = int(start_day) if start_day else None
     end_day = int(end_day) if end_day else None
+    top_n = int(top_n) if top_n else None
 
     try:
-        articles = wrapper.get_most_viewed_articles(year, month, day, start_day, end_day)
+        articles = wrapper.get_most_viewed_articles(year, month, day, start_day, end_day, top_n)
         return jsonify(articles)
     except CustomException as e:
         error_message = str(e)
@@ -57,6 +64,7 @@ def get_article_view_count(article_title):
     end_day = int(end_day) if end_day else None
 
     try:
+        article_title = wrapper.resolve_article_title(article_title)
         view_count = wrapper.get_article_view_count(article_title, year, month, start_day, end_day)
         return jsonify({'article': article_title, 'view_count': view_count})
     except CustomException as e:
@@ -71,6 +79,7 @@ def get_most_views_day(article_title):
     month = int(request.args.get('month', 1))
 
     try:
+        article_title = wrapper.resolve_article_title(article_title)
         most_views_day = wrapper.get_day_with_most_views(article_title, year, month)
         return jsonify({'article': article_title, 'most_views_day': most_views_day})
     except CustomException as e:
@@ -78,6 +87,20 @@ def get_most_views_day(article_title):
         return render_template('error.html', error_message=error_message)
 
 
+@app.route('/articles/search')
+def search_articles():
+    """Endpoint that returns article titles matching a search query."""
+    query = request.args.get('q', '')
+    limit = int(request.args.get('limit', 10))
+
+    try:
+        articles = wrapper.search_articles(query, limit)
+        return jsonify(articles)
+    except CustomException as e:
+        error_message = str(e)
+        return render_template('error.html', error_message=error_message)
+
+
 @app.errorhandler(404)
 def page_not_found(e):
     return render_template('404.html'), 404
@@ -0,0 +1,162 @@
+"""
+Opt-in per-request profiling for the Flask app using cProfile
+"""
+import cProfile
+import io
+import marshal
+import pstats
+import sys
+import threading
+import uuid
+from collections import OrderedDict
+from typing import List, Dict
+from flask import Flask, Response, current_app, g, jsonify, request
+
+
+class RequestProfiler:
+    """
+    Profiles requests on demand, with the X-Profile header or profile query parameter,
+    and/or samples 1 in N requests and aggregates their hot functions.
+
+    Configured with PROFILING_ENABLED, PROFILING_SAMPLE_RATE and PROFILING_MAX_PROFILES.
+    If profiling is disabled and the sample rate is 0, no hooks are registered at all.
+
+    Only one cProfile profiler can run at a time: per thread up to Python 3.11, and per
+    interpreter from Python 3.12, where it also records other threads' requests. A request
+    that can't be profiled because another one is being profiled gets an X-Profile-Error header.
+    """
+
+    def __init__(self, app: Flask = None):
+        self.enabled = False
+        self.sample_rate = 0
+        self.max_profiles = 20
+
+        self.profiles = OrderedDict()
+        self.sampled_stats = None
+        self.sampled_requests = 0
+        self.request_count = 0
+        self.lock = threading.Lock()
+
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app: Flask) -> None:
+        """
+        Registers the profiling hooks and download endpoints if profiling is configured.
+
+        :param app:
+        :return:
+        """
+        self.enabled = app.config.get('PROFILING_ENABLED', False)
+        self.sample_rate = app.config.get('PROFILING_SAMPLE_RATE', 0)
+        self.max_profiles = app.config.get('PROFILING_MAX_PROFILES', 20)
+
+        if not self.enabled and not self.sample_rate:
+            return
+
+        app.before_request(self._start_profile)
+        app.after_request(self._stop_profile)
+        app.teardown_request(self._teardown_profile)
+
+        app.add_url_rule('/profiles', 'list_profiles', self.list_profiles)
+        app.add_url_rule('/profiles/<profile_id>', 'download_profile', self.download_profile)
+        app.add_url_rule('/profiles/hot_functions', 'hot_functions', self.hot_functions)
+
+    def list_profiles(self):
+        """Endpoint that returns the stored profiles, most recent last."""
+        with self.lock:
+            return jsonify([{'id': profile_id, 'path': path} for profile_id, (path, _) in self.profiles.items()])
+
+    def download_profile(self, profile_id: str):
+        """Endpoint that returns a stored profile, readable with pstats.Stats or snakeviz."""
+        with self.lock:
+            profile = self.profiles.get(profile_id)
+        if profile is None:
+            return jsonify({'error': f"Profile {profile_id} not found"}), 404
+
+        return Response(profile[1], mimetype='application/octet-stream',
+                        headers={'Content-Disposition': f'attachment; filename={profile_id}.prof'})
+
+    def hot_functions(self):
+        """Endpoint that returns the functions with the most time spent across sampled requests."""
+        limit = int(request.args.get('limit', 20))
+        with self.lock:
+            functions = self._get_hot_functions(self.sampled_stats, limit) if self.sampled_stats else []
+            return jsonify({'sampled_requests': self.sampled_requests, 'functions': functions})
+
+    def _start_profile(self) -> None:
+        """Starts a profiler if the request asks for one or is sampled."""
+        requested = self.enabled and (request.headers.get('X-Profile') == '1' or request.args.get('profile') == '1')
+
+        sampled = False
+        if self.sample_rate:
+            with self.lock:
+                self.request_count += 1
+                sampled = self.request_count % self.sample_rate == 0
+
+        if not requested and not sampled:
+            return
+
+        # another profiler is already running, see the class docstring. Up to Python 3.11
+        # enabling a second one would silently replace it, from 3.12 it raises ValueError
+        profile = cProfile.Profile()
+        try:
+            if sys.getprofile() is not None:
+                raise ValueError("Another profiling tool is already active")
+            profile.enable()
+        except ValueError as e:
+            current_app.logger.info(f"Failed to profile {request.full_path}: {e}")
+            if requested:
+                g.profile_error = f"{e}"
+            return
+        g.profile = (profile, requested, sampled)
+
+    def _stop_profile(self, response: Response) -> Response:
+        """Stops the request's profiler and stores or aggregates its stats."""
+        profile_error = g.pop('profile_error', None)
+        if profile_error is not None:
+            response.headers['X-Profile-Error'] = profile_error
+
+        profile_info = g.pop('profile', None)
+        if profile_info is None:
+            return response
+
+        profile, requested, sampled = profile_info
+        profile.disable()
+        stats = pstats.Stats(profile, stream=io.StringIO())
+
+        with self.lock:
+            if requested:
+                profile_id = uuid.uuid4().hex
+                self.profiles[profile_id] = (request.full_path, marshal.dumps(stats.stats))
+                while len(self.profiles) > self.max_profiles:
+                    self.profiles.popitem(last=False)
+                response.headers['X-Profile-Id'] = profile_id
+            if sampled:
+                if self.sampled_stats is None:
+                    self.sampled_stats = stats
+                else:
+                    self.sampled_stats.add(stats)
+                self.sampled_requests += 1
+
+        return response
+
+    def _teardown_profile(self, exception: BaseException = None) -> None:
+        """Stops the request's profiler if _stop_profile() didn't run because of an unhandled exception."""
+        profile_info = g.pop('profile', None)
+        if profile_info is not None:
+            profile_info[0].disable()
+
+    @staticmethod
+    def _get_hot_functions(stats: pstats.Stats, limit: int) -> List[Dict]:
+        """
+        Returns the functions with the highest own time from profiling stats.
+
+        :param stats:
+        :param limit:
+        :return: a list of dictionaries
+        """
+        hot_functions = sorted(stats.stats.items(), key=lambda item: item[1][2], reverse=True)[:limit]
+        return [{'function': pstats.func_std_string(func), 'calls': calls,
+                 'total_time': total_time, 'cumulative_time': cumulative_time}
+                for func, (_, calls, total_time, cumulative_time, _) in hot_functions]
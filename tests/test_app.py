@@ -29,6 +29,16 @@ def test_get_most_viewed_articles(mock_get_most_viewed_articles):
 	assert res[0]['article'] == 'test'
 
 
+@patch.object(wikipedia.wikipedia_api.WikipediaAPIWrapper, 'get_most_viewed_articles')
+def test_get_most_viewed_articles_top_n(mock_get_most_viewed_articles):
+	"""Test that /most_viewed_articles passes the top_n query parameter through."""
+	mock_get_most_viewed_articles.return_value = [{'article': 'test'}]
+	response = app.test_client().get('/most_viewed_articles?year=2020&month=4&start_day=4&end_day=11&top_n=10')
+
+	assert response.status_code == 200
+	mock_get_most_viewed_articles.assert_called_with(2020, 4, None, 4, 11, 10)
+
+
 @patch.object(wikipedia.wikipedia_api.WikipediaAPIWrapper, 'get_most_viewed_articles')
 def test_get_most_viewed_articles_exception(mock_get_most_viewed_articles):
 	"""Test that /most_viewed_articles bubbles up an Exception."""
@@ -50,8 +60,9 @@ def test_get_article_view_count(mock_get_article_view_count):
 
 	assert response.status_code == 200
 	assert type(res) is dict
-	assert res['article'] == article_title
+	assert res['article'] == 'Test'
 	assert res['view_count'] == article_view_count
+	mock_get_article_view_count.assert_called_with('Test', 2023, 1, None, None)
 
 
 @patch.object(wikipedia.wikipedia_api.WikipediaAPIWrapper, 'get_article_view_count')
@@ -65,6 +76,16 @@ def test_get_article_view_count_exception(mock_get_article_view_count):
 	assert b'Custom Error' in response.data
 
 
+@patch.object(wikipedia.wikipedia_api.WikipediaAPIWrapper, 'get_article_view_count')
+def test_get_article_view_count_invalid_title(mock_get_article_view_count):
+	"""Test that /article_view_count displays an error for an impossible title without querying it."""
+	response = app.test_client().get('/article_view_count/Main{Page}')
+
+	assert response.status_code == 200
+	assert b'Invalid article title' in response.data
+	mock_get_article_view_count.assert_not_called()
+
+
 @patch.object(wikipedia.wikipedia_api.WikipediaAPIWrapper, 'get_day_with_most_views')
 def test_get_most_views_day(mock_get_day_with_most_views):
 	"""Test that /most_views_day endpoint returns 200 status and appropriate json response."""
@@ -76,7 +97,7 @@ def test_get_most_views_day(mock_get_day_with_most_views):
 
 	assert response.status_code == 200
 	assert type(res) is dict
-	assert res['article'] == article_title
+	assert res['article'] == 'Test'
 	assert res['most_views_day'] == most_views_date
 
 
@@ -89,3 +110,15 @@ def test_get_most_views_day_exception(mock_get_day_with_most_views):
 
 	assert response.status_code == 200
 	assert b'Custom Error' in response.data
+
+
+@patch.object(wikipedia.wikipedia_api.WikipediaAPIWrapper, 'search_articles')
+def test_search_articles(mock_search_articles):
+	"""Test that /articles/search endpoint returns 200 status and appropriate json response."""
+	mock_search_articles.return_value = ['Main_Page']
+	response = app.test_client().get('/articles/search?q=main&limit=5')
+	res = json.loads(response.data.decode('utf-8'))
+
+	assert response.status_code == 200
+	assert res == ['Main_Page']
+	mock_search_articles.assert_called_with('main', 5)
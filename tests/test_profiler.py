@@ -0,0 +1,117 @@
+"""
+Tests for per-request profiling in profiler.py
+"""
+import cProfile
+import marshal
+import sys
+import pytest
+from flask import Flask
+from profiler import RequestProfiler
+
+
+def create_app(**config):
+	"""Creates a Flask app with a single route and profiling configured."""
+	app = Flask(__name__)
+	app.config.update(config)
+
+	@app.route('/test')
+	def test_route():
+		return 'test'
+
+	@app.route('/error')
+	def error_route():
+		raise ValueError('test error')
+
+	profiler = RequestProfiler(app)
+	return app, profiler
+
+
+def test_profiling_disabled():
+	"""Test that no hooks or endpoints are registered when profiling is disabled."""
+	app, profiler = create_app()
+	response = app.test_client().get('/test?profile=1')
+
+	assert response.status_code == 200
+	assert 'X-Profile-Id' not in response.headers
+	assert not app.before_request_funcs
+	assert app.test_client().get('/profiles').status_code == 404
+
+
+def test_profile_requested():
+	"""Test that a request with the X-Profile header is profiled and the profile can be downloaded."""
+	app, profiler = create_app(PROFILING_ENABLED=True)
+	client = app.test_client()
+
+	assert 'X-Profile-Id' not in client.get('/test').headers
+
+	response = client.get('/test', headers={'X-Profile': '1'})
+	profile_id = response.headers['X-Profile-Id']
+
+	assert response.status_code == 200
+	assert client.get('/profiles').json == [{'id': profile_id, 'path': '/test?'}]
+
+	response = client.get(f'/profiles/{profile_id}')
+	assert response.status_code == 200
+	assert isinstance(marshal.loads(response.data), dict)
+
+
+def test_profile_requested_while_profiling():
+	"""Test that a requested profile that can't run because another profiler is active reports an error."""
+	app, profiler = create_app(PROFILING_ENABLED=True)
+	other_profile = cProfile.Profile()
+	other_profile.enable()
+	try:
+		response = app.test_client().get('/test?profile=1')
+	finally:
+		other_profile.disable()
+
+	assert response.status_code == 200
+	assert 'X-Profile-Id' not in response.headers
+	assert response.headers['X-Profile-Error']
+	assert not profiler.profiles
+
+
+def test_profile_requested_with_exception():
+	"""Test that the profiler is stopped when an unhandled exception skips after_request."""
+	app, profiler = create_app(PROFILING_ENABLED=True, TESTING=True)
+	client = app.test_client()
+
+	with pytest.raises(ValueError):
+		client.get('/error?profile=1')
+
+	assert sys.getprofile() is None
+	response = client.get('/test?profile=1')
+	assert 'X-Profile-Error' not in response.headers
+	assert response.headers['X-Profile-Id']
+
+
+def test_profile_not_found():
+	"""Test that downloading an unknown profile returns 404."""
+	app, profiler = create_app(PROFILING_ENABLED=True)
+	response = app.test_client().get('/profiles/unknown')
+
+	assert response.status_code == 404
+
+
+def test_max_profiles():
+	"""Test that only the most recent profiles are stored."""
+	app, profiler = create_app(PROFILING_ENABLED=True, PROFILING_MAX_PROFILES=2)
+	client = app.test_client()
+	profile_ids = [client.get('/test?profile=1').headers['X-Profile-Id'] for _ in range(3)]
+
+	assert list(profiler.profiles) == profile_ids[1:]
+
+
+def test_sampled_profiling():
+	"""Test that 1 in N requests are sampled and aggregated into hot functions."""
+	app, profiler = create_app(PROFILING_SAMPLE_RATE=2)
+	client = app.test_client()
+	for _ in range(4):
+		response = client.get('/test?profile=1')
+		assert 'X-Profile-Id' not in response.headers
+
+	res = client.get('/profiles/hot_functions?limit=5').json
+
+	assert res['sampled_requests'] == 2
+	assert 0 < len(res['functions']) <= 5
+	assert set(res['functions'][0]) == {'function', 'calls', 'total_time', 'cumulative_time'}
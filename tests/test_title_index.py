@@ -0,0 +1,116 @@
+"""
+Tests for logic in title_index.py
+"""
+import sys
+import threading
+import pytest
+from wikipedia.title_index import TitleIndex
+
+
+def test_normalize():
+    """Tests that spaces, underscores and the first letter are normalized the way Wikipedia stores titles."""
+    assert TitleIndex.normalize('  Main  Page ') == 'Main_Page'
+    assert TitleIndex.normalize('main__page_') == 'Main_page'
+
+
+def test_resolve():
+    """
+    Tests that resolve() keeps known titles case-sensitive, resolves a case mismatch to the only
+    known title matching it ignoring case, and falls back to the normalized title otherwise.
+    """
+    title_index = TitleIndex()
+    title_index.add_titles(['Main_Page', 'Taylor_Swift', 'AIDS', 'Aids'])
+
+    assert title_index.resolve('main Page') == 'Main_Page'
+    assert title_index.resolve('taylor swift') == 'Taylor_Swift'
+    assert title_index.resolve('aids') == 'Aids'
+    assert title_index.resolve('AIds') == 'AIds'
+    assert title_index.resolve('Unknown title') == 'Unknown_title'
+
+
+@pytest.mark.parametrize('title', ['', '   ', 'Main#Page', 'Main[Page]', 'Main\x7fPage', 'a' * 256])
+def test_resolve_invalid_title(title):
+    """Tests that resolve() raises an exception for titles that can never exist."""
+    with pytest.raises(Exception):
+        TitleIndex().resolve(title)
+
+
+def test_search():
+    """Tests that search() returns prefix matches first, ignoring case, followed by close matches."""
+    title_index = TitleIndex()
+    title_index.add_articles([{'article': 'Main_Page'}, {'article': 'Main_Street'},
+                              {'article': 'Maine'}, {'article': 'Mainz'},
+                              {'article': 'AIDS'}, {'article': 'Aids'}])
+
+    assert title_index.search('main s') == ['Main_Street']
+    assert title_index.search('main', limit=3) == ['Main_Page', 'Main_Street', 'Maine']
+    assert title_index.search('Mian_Page') == ['Main_Page']
+    assert title_index.search('') == []
+    assert title_index.search('aids') == ['AIDS', 'Aids']
+
+
+def test_search_after_adding_titles():
+    """Tests that titles added after a search are found by later searches."""
+    title_index = TitleIndex()
+    title_index.add_titles(['Main_Page'])
+    assert title_index.search('Taylor') == []
+
+    title_index.add_titles(['Taylor_Swift'])
+    assert title_index.search('Taylor') == ['Taylor_Swift']
+    assert len(title_index) == 2
+
+
+def test_search_close_matches_are_bounded():
+    """Tests that close matches are only looked for among titles sorting next to the query."""
+    title_index = TitleIndex()
+    title_index.add_titles(['Main_Page', 'Xain_Page'] + [f'Mz_{i:03d}' for i in range(50)]
+                           + [f'O_{i:03d}' for i in range(50)])
+
+    assert title_index.search('Main_Pgae') == ['Main_Page']
+    assert title_index.search('Nain_Page') == []
+
+
+def test_max_titles():
+    """Tests that the least recently added titles are dropped once the index is full."""
+    title_index = TitleIndex(max_titles=2)
+    title_index.add_titles(['Main_Page', 'Taylor_Swift'])
+    title_index.add_titles(['Main_Page', 'AIDS'])
+
+    assert len(title_index) == 2
+    assert title_index.search('Main') == ['Main_Page']
+    assert title_index.search('Taylor') == []
+    assert title_index.resolve('taylor swift') == 'Taylor_swift'
+
+
+def test_concurrent_add_and_search():
+    """Tests that titles can be added from one thread while another thread searches."""
+    title_index = TitleIndex()
+    title_index.add_titles([f'Title_{i}' for i in range(20000)])
+    errors = []
+
+    def add_titles():
+        for i in range(2000):
+            title_index.add_titles([f'New_title_{i}'])
+
+    def search():
+        try:
+            for _ in range(50):
+                title_index.search('Title_1')
+        except Exception as e:
+            errors.append(e)
+
+    # switch threads as often as possible so adding happens during a search
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        threads = [threading.Thread(target=add_titles), threading.Thread(target=search)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        sys.setswitchinterval(switch_interval)
+
+    assert not errors
+    assert len(title_index) == 22000
+    assert title_index.search('New_title_1999')[0] == 'New_title_1999'
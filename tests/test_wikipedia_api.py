@@ -74,6 +74,79 @@ def test_get_most_viewed_articles_for_range(mock_get_articles_request):
                         {'article': 'test3', 'views': 100}]
 
 
+@patch.object(WikipediaAPIWrapper, '_get_articles_request')
+def test_get_most_viewed_articles_top_n(mock_get_articles_request):
+    """
+    Tests that calling get_most_viewed_articles() with year, month, and top_n
+    only returns the top_n most viewed articles.
+    """
+    year = 2020
+    month = 3
+
+    mock_get_articles_request.return_value = [
+        {'articles': [{'article': 'test1'}, {'article': 'test2'}, {'article': 'test3'}]}
+    ]
+
+    articles = WikipediaAPIWrapper().get_most_viewed_articles(year, month, top_n=2)
+
+    assert articles == [{'article': 'test1'}, {'article': 'test2'}]
+
+
+@patch.object(WikipediaAPIWrapper, '_get_articles_request')
+def test_get_most_viewed_articles_top_n_for_range(mock_get_articles_request):
+    """
+    Tests that calling get_most_viewed_articles() with a date range and top_n
+    returns the top_n articles by total views across all days, most viewed first.
+    """
+    year = 2020
+    month = 3
+    start_day = 4
+    end_day = 6
+
+    mock_get_articles_request.side_effect = [
+        [{'articles': [{'article': 'test1', 'views': 300}, {'article': 'test2', 'views': 200},
+                       {'article': 'test3', 'views': 50}]}],
+        [{'articles': [{'article': 'test2', 'views': 400}, {'article': 'test3', 'views': 100},
+                       {'article': 'test4', 'views': 90}]}],
+        [{'articles': [{'article': 'test4', 'views': 250}, {'article': 'test1', 'views': 10}]}]
+    ]
+
+    articles = WikipediaAPIWrapper().get_most_viewed_articles(year, month, start_day=start_day,
+                                                              end_day=end_day, top_n=2)
+
+    assert mock_get_articles_request.call_count == 3
+    assert articles == [{'article': 'test2', 'views': 600},
+                        {'article': 'test4', 'views': 340}]
+
+
+@patch.object(WikipediaAPIWrapper, '_get_articles_request')
+def test_get_most_viewed_articles_top_n_for_range_ties(mock_get_articles_request):
+    """
+    Tests that calling get_most_viewed_articles() with a date range and top_n
+    ranks articles with the same total views by name.
+    """
+    mock_get_articles_request.side_effect = [
+        [{'articles': [{'article': 'b', 'views': 10}, {'article': 'a', 'views': 5}]}],
+        [{'articles': [{'article': 'c', 'views': 10}, {'article': 'a', 'views': 5}]}]
+    ]
+
+    articles = WikipediaAPIWrapper().get_most_viewed_articles(2020, 3, start_day=4, end_day=5, top_n=2)
+
+    assert articles == [{'article': 'a', 'views': 10}, {'article': 'b', 'views': 10}]
+
+
+@patch.object(WikipediaAPIWrapper, '_get_articles_request')
+def test_get_most_viewed_articles_top_n_user_error(mock_get_articles_request):
+    """
+    Tests that calling get_most_viewed_articles() with a top_n smaller than 1 raises an exception.
+    """
+    with pytest.raises(Exception) as e:
+        WikipediaAPIWrapper().get_most_viewed_articles(2020, 3, top_n=0)
+
+    mock_get_articles_request.assert_not_called()
+    assert str(e.value) == 'top_n must be a positive integer'
+
+
 @patch.object(WikipediaAPIWrapper, '_get_articles_request')
 def test_get_most_viewed_articles_exception(mock_get_articles_request):
     """
@@ -134,14 +207,14 @@ def test_get_article_view_count(mock_get_articles_request):
     Tests that calling get_article_view_count() with article title, year, and month
     forms the correct Wikipedia API url endpoint and returns the correct view count.
     """
-    article_title = "test1"
+    article_title = "Test1"
     year = 2020
     month = 3
     start = f'{year}{month:02d}01'
     end = f'{year}{month:02d}31'
 
     mock_get_articles_request.return_value = [
-        {'article': 'test1', 'views': 300},
+        {'article': 'Test1', 'views': 300},
         {'article': 'test2', 'views': 200}
     ]
 
@@ -158,7 +231,7 @@ def test_get_article_view_count_for_range(mock_get_articles_request):
     Tests that calling get_article_view_count() with article title, year, month, start_day, and end_day
     forms the correct Wikipedia API url endpoint and returns the correct view count.
     """
-    article_title = "test1"
+    article_title = "Test1"
     year = 2020
     month = 3
     start_day = 10
@@ -167,8 +240,8 @@ def test_get_article_view_count_for_range(mock_get_articles_request):
     end = f'{year}{month:02d}{end_day:02d}'
 
     mock_get_articles_request.return_value = [
-        {'article': 'test1', 'views': 300},
-        {'article': 'test1', 'views': 200}
+        {'article': 'Test1', 'views': 300},
+        {'article': 'Test1', 'views': 200}
     ]
 
     view_count = WikipediaAPIWrapper().get_article_view_count(article_title, year, month,
@@ -185,7 +258,7 @@ def test_get_article_view_count_for_range_user_error(mock_get_articles_request):
     Tests that calling get_article_view_count() with article title, year, month,
     as well as start_day and end_day, but the start_day > end_day, an exception is raised up.
     """
-    article_title = "test1"
+    article_title = "Test1"
     year = 2020
     month = 3
     start_day = 5
@@ -211,7 +284,7 @@ def test_get_article_view_count_month_user_error(mock_get_articles_request):
     a bad month value
     forms the correct Wikipedia API url endpoint and returns the expected data.
     """
-    article_title = "test1"
+    article_title = "Test1"
     year = 2020
     month = 0
 
@@ -228,7 +301,7 @@ def test_get_article_view_count_no_response(mock_get_articles_request):
     Tests that when calling get_article_view_count() with article title, year, and month
     and the Wikipedia API returns with no data, then the view count returned is 0.
     """
-    article_title = "test1"
+    article_title = "Test1"
     year = 2020
     month = 3
     start = f'{year}{month:02d}01'
@@ -241,22 +314,63 @@ def test_get_article_view_count_no_response(mock_get_articles_request):
     assert view_count == 0
 
 
+@patch.object(WikipediaAPIWrapper, '_get_articles_request')
+def test_resolve_article_title(mock_get_articles_request):
+    """
+    Tests that resolve_article_title() normalizes spaces and the first letter, and resolves
+    a case mismatch to the only most viewed article returned earlier with that title ignoring case.
+    """
+    mock_get_articles_request.return_value = [
+        {'articles': [{'article': 'Taylor_Swift'}, {'article': 'AIDS'}, {'article': 'Aids'}]}
+    ]
+    wrapper = WikipediaAPIWrapper()
+    wrapper.get_most_viewed_articles(2020, 3)
+
+    assert wrapper.resolve_article_title('taylor swift') == 'Taylor_Swift'
+    assert wrapper.resolve_article_title('aids') == 'Aids'
+    assert wrapper.resolve_article_title('main page') == 'Main_page'
+
+
+def test_resolve_article_title_invalid_title():
+    """
+    Tests that resolve_article_title() raises an exception for an impossible title.
+    """
+    with pytest.raises(Exception) as e:
+        WikipediaAPIWrapper().resolve_article_title('Main<Page>')
+
+    assert str(e.value) == 'Invalid article title: Main<Page>'
+
+
+@patch.object(WikipediaAPIWrapper, '_get_articles_request')
+def test_search_articles(mock_get_articles_request):
+    """
+    Tests that search_articles() finds titles of most viewed articles returned earlier.
+    """
+    mock_get_articles_request.return_value = [
+        {'articles': [{'article': 'Main_Page'}, {'article': 'Taylor_Swift'}]}
+    ]
+    wrapper = WikipediaAPIWrapper()
+    wrapper.get_most_viewed_articles(2020, 3)
+
+    assert wrapper.search_articles('taylor') == ['Taylor_Swift']
+
+
 @patch.object(WikipediaAPIWrapper, '_get_articles_request')
 def test_get_day_with_most_views(mock_get_articles_request):
     """
     Tests that calling get_day_with_most_views() with article title, year, and month
     forms the correct Wikipedia API url endpoint and returns the stringified date.
     """
-    article_title = "test1"
+    article_title = "Test1"
     year = 2020
     month = 3
     start = f'{year}{month:02d}01'
     end = f'{year}{month:02d}31'
 
     mock_get_articles_request.return_value = [
-        {'article': 'test1', 'views': 300, 'timestamp': "2020030500"},
-        {'article': 'test1', 'views': 200, 'timestamp': "2020032000"},
-        {'article': 'test1', 'views': 700, 'timestamp': "2020031900"}
+        {'article': 'Test1', 'views': 300, 'timestamp': "2020030500"},
+        {'article': 'Test1', 'views': 200, 'timestamp': "2020032000"},
+        {'article': 'Test1', 'views': 700, 'timestamp': "2020031900"}
     ]
 
     date = WikipediaAPIWrapper().get_day_with_most_views(article_title, year, month)
@@ -272,7 +386,7 @@ def test_get_day_with_most_views_exception(mock_get_articles_request):
     Tests that when calling get_day_with_most_views() with article title, year, and month
     and the Wikipedia API throws an error, an exception is raised up.
     """
-    article_title = "test1"
+    article_title = "Test1"
     year = 2020
     month = 3
     start = f'{year}{month:02d}01'
@@ -294,7 +408,7 @@ def test_get_day_with_most_views_no_response(mock_get_articles_request):
     Tests that when calling get_day_with_most_views() with article title, year, and month
     and the Wikipedia API returns with no data, a null date is returned.
     """
-    article_title = "test1"
+    article_title = "Test1"
     year = 2020
     month = 3
     start = f'{year}{month:02d}01'
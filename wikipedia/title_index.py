@@ -0,0 +1,153 @@
+"""
+Local index of known Wikipedia article titles used to resolve titles without querying the Wikipedia API
+"""
+
+import bisect
+import difflib
+import threading
+from typing import Iterable, List, Dict
+from exception import CustomException
+
+# Characters that can never appear in a Wikipedia article title
+INVALID_TITLE_CHARACTERS = set('#<>[]|{}')
+MAX_TITLE_BYTES = 255
+# Number of neighbouring titles on each side of the query compared for close matches
+CLOSE_MATCH_WINDOW = 25
+
+
+class TitleIndex:
+    def __init__(self, max_titles: int = 100000):
+        self.max_titles = max_titles
+        # normalized titles, oldest first
+        self.titles = {}
+        # case folded title -> titles
+        self.folded_titles = {}
+        # sorted (case folded title, title) pairs, rebuilt lazily for searches
+        self.sorted_titles = []
+        self.sorted_titles_stale = False
+        # the index is shared by requests served on different threads
+        self.lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.titles)
+
+    @staticmethod
+    def normalize(title: str) -> str:
+        """
+        Normalizes a title the way Wikipedia stores it, using underscores instead of spaces
+        and an uppercase first letter. The rest of the title is case-sensitive.
+
+        :param title:
+        :return: normalized title
+        """
+        title = '_'.join(title.replace('_', ' ').split())
+        return title[:1].upper() + title[1:]
+
+    @staticmethod
+    def validate(title: str) -> None:
+        """
+        Raises an exception if the title can never be a Wikipedia article title.
+
+        :param title: normalized title
+        :return:
+        """
+        if not title:
+            raise CustomException("Article title cannot be empty")
+        if any(c in INVALID_TITLE_CHARACTERS or ord(c) < 32 or ord(c) == 127 for c in title):
+            raise CustomException(f"Invalid article title: {title}")
+        if len(title.encode('utf-8')) > MAX_TITLE_BYTES:
+            raise CustomException(f"Article title cannot be longer than {MAX_TITLE_BYTES} bytes")
+
+    def add_titles(self, titles: Iterable[str]) -> None:
+        """
+        Adds titles to the index, e.g. from cached most viewed articles or a title dump.
+        Once the index holds max_titles titles, the least recently added ones are dropped.
+
+        :param titles:
+        :return:
+        """
+        titles = [self.normalize(title) for title in titles]
+        with self.lock:
+            for title in titles:
+                if not title:
+                    continue
+                # re-adding a title makes it the most recently added
+                if title in self.titles:
+                    del self.titles[title]
+                else:
+                    self.folded_titles.setdefault(title.casefold(), set()).add(title)
+                self.titles[title] = None
+
+                if len(self.titles) > self.max_titles:
+                    oldest_title = next(iter(self.titles))
+                    del self.titles[oldest_title]
+                    folded_titles = self.folded_titles[oldest_title.casefold()]
+                    folded_titles.discard(oldest_title)
+                    if not folded_titles:
+                        del self.folded_titles[oldest_title.casefold()]
+                self.sorted_titles_stale = True
+
+    def add_articles(self, articles: List[Dict]) -> None:
+        """
+        Adds the titles of a list of articles returned by the Wikipedia API to the index.
+
+        :param articles:
+        :return:
+        """
+        self.add_titles(article['article'] for article in articles)
+
+    def resolve(self, title: str) -> str:
+        """
+        Returns the title as Wikipedia stores it, raising an exception if it can never exist.
+        If the title isn't known but exactly one known title matches it ignoring case,
+        that title is returned instead.
+
+        :param title:
+        :return: resolved title
+        """
+        title = self.normalize(title)
+        self.validate(title)
+
+        with self.lock:
+            if title in self.titles:
+                return title
+            folded_titles = self.folded_titles.get(title.casefold(), set())
+            return next(iter(folded_titles)) if len(folded_titles) == 1 else title
+
+    def search(self, query: str, limit: int = 10) -> List[str]:
+        """
+        Returns known titles starting with the query, ignoring case, followed by close matches.
+        Close matches are only looked for among the titles sorting next to the query,
+        so a typo near the start of the query won't be matched.
+
+        :param query:
+        :param limit:
+        :return: a list of titles
+        """
+        query = self.normalize(query).casefold()
+        if not query or limit < 1:
+            return []
+
+        with self.lock:
+            if self.sorted_titles_stale:
+                self.sorted_titles = sorted((title.casefold(), title) for title in self.titles)
+                self.sorted_titles_stale = False
+            sorted_titles = self.sorted_titles
+
+        matches = []
+        start = bisect.bisect_left(sorted_titles, (query,))
+        i = start
+        while i < len(sorted_titles) and len(matches) < limit \
+                and sorted_titles[i][0].startswith(query):
+            matches.append(sorted_titles[i][1])
+            i += 1
+
+        if len(matches) < limit:
+            candidates = {}
+            for folded_title, title in sorted_titles[max(start - CLOSE_MATCH_WINDOW, 0):
+                                                     start + CLOSE_MATCH_WINDOW]:
+                candidates.setdefault(folded_title, []).append(title)
+            for folded_title in difflib.get_close_matches(query, candidates, n=limit, cutoff=0.8):
+                matches.extend(title for title in candidates[folded_title] if title not in matches)
+
+        return matches[:limit]
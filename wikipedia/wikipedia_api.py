@@ -2,30 +2,40 @@
 Logic to calculate info about wikipedia articles using Wikipedia API
 """
 
+import heapq
 import requests
 import calendar
 from typing import Optional, List, Dict
 from flask import request, current_app
 from datetime import timedelta, datetime
 from exception import CustomException
+from wikipedia.title_index import TitleIndex
 
 
 class WikipediaAPIWrapper:
     def __init__(self):
         self.base_url = "https://wikimedia.org/api/rest_v1/metrics/pageviews"
+        self.title_index = TitleIndex()
 
     def get_most_viewed_articles(self, year: int, month: int, day: Optional[int] = None,
-                                 start_day: Optional[int] = None, end_day: Optional[int] = None) -> List[Dict]:
+                                 start_day: Optional[int] = None, end_day: Optional[int] = None,
+                                 top_n: Optional[int] = None) -> List[Dict]:
         """
         Returns a list of the top 1000 most viewed articles for a week or a month.
+        If top_n is given, only the top_n most viewed articles are returned, ranked by views
+        and then by name.
 
         :param year:
         :param month:
         :param day:
         :param start_day:
         :param end_day:
+        :param top_n:
         :return: a list of dictionaries
         """
+        if top_n is not None and top_n < 1:
+            raise CustomException("top_n must be a positive integer")
+
         # API querying based on specific day
         if day:
             url_suffix = f"top/en.wikipedia/all-access/{year}/{month:02d}/{day:02d}"
@@ -50,6 +60,7 @@ class WikipediaAPIWrapper:
 
                 articles_response = self._get_articles_request(url_suffix)
                 articles_response = articles_response[0]['articles'] if articles_response else []
+                self.title_index.add_articles(articles_response)
 
                 existing_articles = {a['article']: a for a in articles_data}
                 for new_article, article_name in ((new_article, new_article['article'])
@@ -69,19 +80,24 @@ class WikipediaAPIWrapper:
                 articles_data.extend(existing_articles.values())
 
                 start_date += delta
+
+            # The merged list isn't ranked, only keep the top_n articles by total views
+            if top_n:
+                articles_data = heapq.nsmallest(top_n, articles_data, key=lambda a: (-a['views'], a['article']))
         else:
             articles_data = self._get_articles_request(url_suffix)
             articles_data = articles_data[0]['articles'] if articles_data else []
+            self.title_index.add_articles(articles_data)
 
         # top 1000 most viewed articles, consistent with Wikipedia's API for list of most viewed articles
-        return articles_data[:1000]
+        return articles_data[:min(top_n, 1000) if top_n else 1000]
 
     def get_article_view_count(self, article_title: str, year: int, month: int,
                                start_day: Optional[int] = None, end_day: Optional[int] = None) -> int:
         """
         Returns the view count for a specific article for a week or a month.
 
-        :param article_title:
+        :param article_title: as returned by resolve_article_title()
         :param year:
         :param month:
         :param start_day:
@@ -113,7 +129,7 @@ class WikipediaAPIWrapper:
         """
         Returns the date when an article got the most page views.
 
-        :param article_title:
+        :param article_title: as returned by resolve_article_title()
         :param year:
         :param month:
         :return: string representing the date in MM/DD/YYYY format
@@ -140,6 +156,28 @@ class WikipediaAPIWrapper:
         date = datetime.strptime(max_views_day, '%Y%m%d%H').strftime('%m/%d/%Y') if max_views_day else None
         return date
 
+    def resolve_article_title(self, article_title: str) -> str:
+        """
+        Returns the article title as Wikipedia stores it, resolved against the titles
+        of most viewed articles seen so far, to pass to get_article_view_count()
+        and get_day_with_most_views().
+
+        :param article_title:
+        :return: resolved article title
+        """
+        return self.title_index.resolve(article_title)
+
+    def search_articles(self, query: str, limit: int = 10) -> List[str]:
+        """
+        Returns article titles matching the query by prefix or close match,
+        from the titles of most viewed articles seen so far.
+
+        :param query:
+        :param limit:
+        :return: a list of article titles
+        """
+        return self.title_index.search(query, limit)
+
     def _get_articles_request(self, url: str) -> List:
         """
         Base request function for the Wikipedia API.
@@ -162,3 +200,4 @@ class WikipediaAPIWrapper:
             raise CustomException(f"{e}")
 
         return articles_data
+